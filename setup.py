@@ -1,5 +1,26 @@
+import os
+
 from setuptools import setup, find_packages
 
+# STRUCTOOLS_MYPYC=1 を指定すると断面計算の基盤モジュールを mypyc で
+# AOT コンパイルする (属性アクセスが C 構造体参照になり数倍高速)。
+# 未指定・mypyc 未導入の環境では従来どおり純 Python のまま配布する。
+# _kernels.py は numba が import 時に __code__ を要求するため、
+# sections.py はインスタンス __dict__ に書き込む cached_property を
+# 使うため、いずれも mypyc のネイティブ化とは両立しない。
+ext_modules = []
+if os.environ.get("STRUCTOOLS_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify([
+        "src/core/section.py",
+    ])
+
+# STRUCTOOLS_CYTHON=1 では cdef 型付きの Cython ミラー
+# (src/steel/_sections_cy.pyx) をコンパイルする。
+if os.environ.get("STRUCTOOLS_CYTHON") == "1":
+    from Cython.Build import cythonize
+    ext_modules += cythonize(["src/steel/_sections_cy.pyx"])
+
 setup(
     name="",
     version="0.0.1",
@@ -10,4 +31,5 @@ setup(
     packages=find_packages(),
     install_requires=open("requirements.txt").read().splitlines(),
     entry_points={"console_scripts": ["ghpicker = ghpicker.cli:main"]},
+    ext_modules=ext_modules,
 )
@@ -10,6 +10,8 @@ class ReinforcementLayout:
 
 class RCRectangularSection(RectangularSection):
     """RC矩形断面の具体的な実装"""
+    __slots__ = ('reinforcement',)
+
     def __init__(self, width: float, height: float, 
                  reinforcement: ReinforcementLayout):
         super().__init__(width, height)
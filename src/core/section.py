@@ -1,6 +1,16 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Protocol, Dict, Any
+from typing import Protocol, Dict, Any, NamedTuple
+
+
+class Point(NamedTuple):
+    """平面上の点 (x, y)
+
+    centroid や shear_center の戻り値として使う。タプルとして
+    そのまま展開でき、.x / .y の名前でもアクセスできる。
+    """
+    x: float
+    y: float
 
 
 # 断面の基本プロトコル
@@ -19,7 +29,8 @@ class SectionProtocol(Protocol):
 # 断面の抽象基底クラス
 class BaseSection(ABC):
     """全ての断面に共通する基本機能を定義"""
-    
+    __slots__ = ()
+
     @abstractmethod
     def calculate_properties(self) -> Dict[str, Any]:
         """断面性能の計算"""
@@ -34,6 +45,8 @@ class BaseSection(ABC):
 # 基本的な断面形状の抽象クラス
 class RectangularSection(BaseSection):
     """矩形断面の基本クラス"""
+    __slots__ = ('width', 'height')
+
     def __init__(self, width: float, height: float):
         self.width = width
         self.height = height
@@ -45,6 +58,8 @@ class RectangularSection(BaseSection):
 
 class CircularSection(BaseSection):
     """円形断面の基本クラス"""
+    __slots__ = ('diameter',)
+
     def __init__(self, diameter: float):
         self.diameter = diameter
 
@@ -52,7 +67,8 @@ class CircularSection(BaseSection):
 # 薄肉断面の基底クラス
 class ThinWalledSection(BaseSection):
     """薄肉断面に共通する機能を定義"""
-    
+    __slots__ = ()
+
     @abstractmethod
     def calculate_warping_constant(self) -> float:
         """そり定数の計算"""
@@ -65,7 +81,7 @@ class ThinWalledSection(BaseSection):
 
 
 # 断面性能の基本データクラス
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SectionProperties:
     """断面性能を保持するデータクラス"""
     area: float
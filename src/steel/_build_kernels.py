@@ -0,0 +1,44 @@
+"""断面性能カーネルの AOT コンパイル用ビルドスクリプト
+
+numba.pycc で calc_lipped_channel をネイティブ拡張 steel_kernels に
+コンパイルする。生成物を src/steel/ に置いておくと _kernels が
+インポート時にそちらを優先して読み込み、実行環境に Numba を
+要求せず JIT ウォームアップも発生しなくなる。
+
+    python -m src.steel._build_kernels
+"""
+
+import os
+
+import numpy as np
+from numba.pycc import CC
+
+# nopython コードから呼び出せるのは njit ディスパッチャだけなので、
+# 公開名 (AOT 拡張に差し替わっている場合がある) ではなくこちらを使う
+from ._kernels import _jit_calc_lipped_channel as _kernel
+
+cc = CC('steel_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export('calc_lipped_channel', 'f8[:](f8, f8, f8, f8, f8, f8)')
+def calc_lipped_channel_aot(h, b, d, t_w, t_f, t_l):
+    """calc_lipped_channel の AOT 版 (結果を長さ 10 の配列で返す)"""
+    (area, x_c, y_c, I_x, I_y,
+     Z_x, Z_y, J, C_w, x_s) = _kernel(h, b, d, t_w, t_f, t_l)
+    out = np.empty(10)
+    out[0] = area
+    out[1] = x_c
+    out[2] = y_c
+    out[3] = I_x
+    out[4] = I_y
+    out[5] = Z_x
+    out[6] = Z_y
+    out[7] = J
+    out[8] = C_w
+    out[9] = x_s
+    return out
+
+
+if __name__ == '__main__':
+    cc.compile()
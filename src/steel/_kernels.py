@@ -0,0 +1,147 @@
+"""断面性能計算の数値カーネル
+
+閉形式の断面性能式を純スカラー演算の関数として切り出したモジュール。
+Numba が利用可能な環境ではインポート時に明示シグネチャ付きで
+ネイティブコードにコンパイルされ (初回呼び出しの JIT 待ちなし)、
+利用できない環境ではそのまま純 Python 実装として動作する。
+"""
+
+# 除算を乗算へ畳み込むための共有定数 (Cython/mypyc/Numba の定数畳み込みが効く)
+HALF = 0.5
+ONE_THIRD = 1.0 / 3.0
+ONE_SIXTH = 1.0 / 6.0
+ONE_TWELFTH = 1.0 / 12.0
+
+try:
+    from numba import njit, guvectorize
+    from numba.types import UniTuple, float64
+except ImportError:
+    njit = None
+    guvectorize = None
+
+
+def calc_lipped_channel(h, b, d, t_w, t_f, t_l):
+    """リップ付き溝形鋼の断面性能を一括評価するカーネル
+
+    共通部分式 (h/2, b/2, b+d/2, 弱軸断面二次モーメント) を一度だけ
+    計算し、(area, x_c, y_c, Ix, Iy, Zx, Zy, J, Cw, x_s) を返す。
+    """
+    half_h = HALF * h
+    lip_arm = b + HALF * d
+
+    # 各板要素の面積を一度だけ計算し、area/x_c/Iy/J で再利用する
+    a_web = h * t_w
+    a_fl = b * t_f
+    a_lp = d * t_l
+
+    area = a_web + 2.0 * a_fl + 2.0 * a_lp
+    x_c = (a_fl * b + 2.0 * a_lp * lip_arm) / area
+
+    I_x = (a_web * h * h * ONE_TWELFTH +
+           2.0 * a_fl * b * b * ONE_THIRD +
+           a_lp * d * d * ONE_SIXTH + 2.0 * a_lp * lip_arm * lip_arm)
+    half_h_sq = half_h * half_h
+    I_y = (a_web * t_w * t_w * ONE_TWELFTH +
+           2.0 * a_fl * half_h_sq + 2.0 * a_lp * half_h_sq)
+
+    Z_x = I_x / half_h
+    Z_y = I_y / x_c
+
+    J = (a_web * t_w * t_w +
+         2.0 * a_fl * t_f * t_f +
+         2.0 * a_lp * t_l * t_l) * ONE_THIRD
+    C_w = (I_y * h * h * 0.25) * (1.0 - 1.5 * b / h)
+
+    d_b = d / b
+    k = 1.0 + d_b * d_b * (t_l / t_f)
+    x_s = b * (h * h * t_w + 4.0 * b * t_f * h * k) / (4.0 * I_y)
+
+    return area, x_c, half_h, I_x, I_y, Z_x, Z_y, J, C_w, x_s
+
+
+def calc_lipped_channel_uniform(h, b, d, t):
+    """板厚が一様 (t_w == t_f == t_l == t) な断面の特殊化カーネル
+
+    冷間成形材では全板要素が同一板厚であることが多い。t を
+    くくり出した簡約式で calc_lipped_channel から板厚の乗算を
+    3 回分削る。
+    """
+    half_h = HALF * h
+    lip_arm = b + HALF * d
+
+    perimeter = h + 2.0 * b + 2.0 * d
+    area = t * perimeter
+    x_c = t * (b * b + 2.0 * d * lip_arm) / area
+
+    I_x = t * (h * h * h * ONE_TWELFTH +
+               2.0 * b * b * b * ONE_THIRD +
+               d * d * d * ONE_SIXTH + 2.0 * d * lip_arm * lip_arm)
+    half_h_sq = half_h * half_h
+    I_y = t * (h * t * t * ONE_TWELFTH + 2.0 * (b + d) * half_h_sq)
+
+    Z_x = I_x / half_h
+    Z_y = I_y / x_c
+
+    J = area * t * t * ONE_THIRD
+    C_w = (I_y * h * h * 0.25) * (1.0 - 1.5 * b / h)
+
+    d_b = d / b
+    k = 1.0 + d_b * d_b
+    x_s = b * t * h * (h + 4.0 * b * k) / (4.0 * I_y)
+
+    return area, x_c, half_h, I_x, I_y, Z_x, Z_y, J, C_w, x_s
+
+
+try:
+    # _build_kernels で生成した AOT コンパイル済み拡張があれば最優先で使う
+    # (Numba 本体への実行時依存も JIT ウォームアップもなくなる)
+    from .steel_kernels import calc_lipped_channel as _aot_calc_lipped_channel
+except ImportError:
+    _aot_calc_lipped_channel = None
+
+
+if njit is not None:
+    # 明示シグネチャを与えてインポート時に AOT 的にコンパイルする
+    # (guvectorize のカーネル本体からも呼ぶため JIT 版は常に作る)
+    _LC_SIG = UniTuple(float64, 10)(
+        float64, float64, float64, float64, float64, float64)
+    _jit_calc_lipped_channel = njit(
+        _LC_SIG, cache=True, fastmath=True)(calc_lipped_channel)
+    calc_lipped_channel = _jit_calc_lipped_channel
+
+    _LC_UNIFORM_SIG = UniTuple(float64, 10)(
+        float64, float64, float64, float64)
+    calc_lipped_channel_uniform = njit(
+        _LC_UNIFORM_SIG, cache=True, fastmath=True)(calc_lipped_channel_uniform)
+
+if _aot_calc_lipped_channel is not None:
+    # AOT 版は長さ 10 の配列を返すが、呼び出し側のタプル展開とは互換
+    calc_lipped_channel = _aot_calc_lipped_channel
+
+
+# Numba なしの環境では None (呼び出し側が NumPy 実装へフォールバックする)
+calc_lipped_channel_batch = None
+
+if guvectorize is not None:
+    # スカラーカーネルを ufunc 化し、バッチ全体を 1 回のネイティブループ
+    # (target='parallel' でコア数分に分割) で処理する
+    @guvectorize(
+        ['void(f8, f8, f8, f8, f8, f8,'
+         ' f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:], f8[:])'],
+        '(),(),(),(),(),()->(),(),(),(),(),(),(),(),(),()',
+        nopython=True, target='parallel')
+    def calc_lipped_channel_batch(h, b, d, t_w, t_f, t_l,
+                                  area, x_c, y_c, I_x, I_y,
+                                  Z_x, Z_y, J, C_w, x_s):
+        """calc_lipped_channel のバッチ版 (10 出力の ufunc)"""
+        res = _jit_calc_lipped_channel(h, b, d, t_w, t_f, t_l)
+        area[0] = res[0]
+        x_c[0] = res[1]
+        y_c[0] = res[2]
+        I_x[0] = res[3]
+        I_y[0] = res[4]
+        Z_x[0] = res[5]
+        Z_y[0] = res[6]
+        J[0] = res[7]
+        C_w[0] = res[8]
+        x_s[0] = res[9]
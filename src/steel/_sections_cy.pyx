@@ -0,0 +1,79 @@
+# cython: language_level=3, boundscheck=False, cdivision=True
+"""LippedChannelSection の Cython ミラー実装
+
+寸法を cdef double として保持し、各プロパティを PyObject の
+ボックス化なしの C 演算にコンパイルする。ビルドは任意で、
+
+    STRUCTOOLS_CYTHON=1 pip install -e .
+
+で生成した拡張を from src.steel._sections_cy import LippedChannelSection
+として利用する。式は sections.py / _kernels.py の実装と同一に保つこと。
+"""
+
+DEF HALF = 0.5
+DEF ONE_THIRD = 1.0 / 3.0
+DEF ONE_SIXTH = 1.0 / 6.0
+DEF ONE_TWELFTH = 1.0 / 12.0
+
+
+cdef class LippedChannelSection:
+    """リップ付き溝形鋼 (Cython 版)"""
+
+    cdef readonly double h
+    cdef readonly double b
+    cdef readonly double d
+    cdef readonly double t_w
+    cdef readonly double t_f
+    cdef readonly double t_l
+
+    def __cinit__(self, double h, double b, double d,
+                  double t_w, double t_f, double t_l):
+        if min(h, b, d) <= 0:
+            raise ValueError("寸法は正の値である必要があります")
+        if min(t_w, t_f, t_l) <= 0:
+            raise ValueError("板厚は正の値である必要があります")
+        self.h = h
+        self.b = b
+        self.d = d
+        self.t_w = t_w
+        self.t_f = t_f
+        self.t_l = t_l
+
+    cpdef double area(self) except? -1:
+        """断面積"""
+        return (self.h * self.t_w +
+                2 * self.b * self.t_f +
+                2 * self.d * self.t_l)
+
+    cpdef double moment_of_inertia_strong(self) except? -1:
+        """強軸断面二次モーメント (Ix)"""
+        cdef double lip_arm = self.b + self.d * HALF
+        cdef double a_lp = self.d * self.t_l
+        return (self.t_w * self.h * self.h * self.h * ONE_TWELFTH +
+                2 * self.t_f * self.b * self.b * self.b * ONE_THIRD +
+                a_lp * self.d * self.d * ONE_SIXTH +
+                2 * a_lp * lip_arm * lip_arm)
+
+    cpdef double moment_of_inertia_weak(self) except? -1:
+        """弱軸断面二次モーメント (Iy)"""
+        cdef double half_h = self.h * HALF
+        cdef double half_h_sq = half_h * half_h
+        return (self.h * self.t_w * self.t_w * self.t_w * ONE_TWELFTH +
+                2 * self.b * self.t_f * half_h_sq +
+                2 * self.d * self.t_l * half_h_sq)
+
+    cpdef double section_modulus_strong(self) except? -1:
+        """強軸断面係数"""
+        return self.moment_of_inertia_strong() / (self.h * HALF)
+
+    cpdef double torsion_constant(self) except? -1:
+        """ねじり定数 (J)"""
+        return (self.h * self.t_w * self.t_w * self.t_w +
+                2 * self.b * self.t_f * self.t_f * self.t_f +
+                2 * self.d * self.t_l * self.t_l * self.t_l) * ONE_THIRD
+
+    cpdef double warping_constant(self) except? -1:
+        """そり定数 (Cw)"""
+        cdef double h = self.h
+        return (self.moment_of_inertia_weak() * h * h * 0.25) * \
+               (1 - 1.5 * self.b / h)
@@ -1,20 +1,46 @@
 from dataclasses import dataclass
 from typing import List, Optional, Any
-from .sections import steel_section
+from .sections import SteelSection
+from ..utils.caching import cached_property
 
 @dataclass
 class beam_member:
     """梁部材クラス"""
-    
-    section: steel_section
+
+    section: SteelSection
     length: float
     supports: List[float]
     load_cases: Optional[List[Any]] = None
-    
+
     def __post_init__(self):
         self.validate_geometry()
-        self.calculate_internal_forces()
-    
+
+    def validate_geometry(self):
+        """形状の妥当性検証"""
+        if self.length <= 0:
+            raise ValueError("部材長は正の値である必要があります")
+        if any(not 0 <= x <= self.length for x in self.supports):
+            raise ValueError("支点位置は部材長の範囲内である必要があります")
+
+    @cached_property
+    def internal_forces(self) -> dict:
+        """断面力 (初回アクセス時に計算)"""
+        return self.calculate_internal_forces()
+
+    def calculate_internal_forces(self) -> dict:
+        """断面力の計算 (単純梁・等分布荷重の閉形式解)
+
+        load_cases には等分布荷重 w を数値で渡す。複数ケースは
+        単純加算し、最大曲げモーメント wL²/8・最大せん断力 wL/2 を返す。
+        """
+        w = float(sum(self.load_cases)) if self.load_cases else 0.0
+        L = self.length
+        return {
+            'moment': w * L * L / 8,
+            'shear': w * L / 2,
+            'reactions': (w * L / 2, w * L / 2),
+        }
+
     def calculate_capacity(self) -> dict:
         """耐力計算"""
         return {
@@ -22,9 +48,9 @@ class beam_member:
             'shear': self.shear_capacity(),
             'buckling': self.buckling_capacity()
         }
-    
+
     def check_safety(self) -> dict:
         """安全性照査"""
         capacities = self.calculate_capacity()
         demands = self.calculate_demands()
-        return {k: demands[k]/v for k, v in capacities.items()}
\ No newline at end of file
+        return {k: demands[k]/v for k, v in capacities.items()}
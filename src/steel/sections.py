@@ -1,61 +1,77 @@
-from ..core.section import ThinWalledSection, SectionProperties
-from dataclasses import dataclass
-from abc import abstractmethod, ABC
+from ..core.section import ThinWalledSection, SectionProperties, Point
+from ..utils.caching import cached_property
+from ._kernels import (HALF, ONE_THIRD, ONE_SIXTH, ONE_TWELFTH,
+                       calc_lipped_channel, calc_lipped_channel_batch,
+                       calc_lipped_channel_uniform)
+from dataclasses import dataclass, replace
+from enum import IntEnum
+from functools import lru_cache
 from typing import Protocol, Tuple
 
+import numpy as np
+
+# Rust 拡張 (structools-rust) が導入済みならバッチ計算をそちらへ委譲する
+try:
+    from _structools_rs import lc_properties as _lc_properties_rs
+except ImportError:
+    _lc_properties_rs = None
+
+
+class SteelSection(Protocol):
+    """鋼構造断面のプロトコル
+
+    ABC ではなく typing.Protocol として定義することで、実装クラスの
+    構築時に ABCMeta の抽象メソッド検査を通らず、MRO にも実行時
+    コストを足さない。実装側は同名のプロパティを備えていればよい。
+    """
+    __slots__ = ()
 
-class steel_section(ABC):
-    """鋼構造断面の抽象基底クラス"""
-    
     @property
-    @abstractmethod
     def area(self) -> float:
         """断面積"""
-        pass
+        ...
 
     @property
-    @abstractmethod
     def centroid(self) -> Tuple[float, float]:
         """重心位置 (x, y)"""
-        pass
+        ...
 
     @property
-    @abstractmethod
     def moment_of_inertia_strong(self) -> float:
         """強軸断面二次モーメント"""
-        pass
+        ...
 
     @property
-    @abstractmethod
     def moment_of_inertia_weak(self) -> float:
         """弱軸断面二次モーメント"""
-        pass
+        ...
 
     @property
-    @abstractmethod
     def section_modulus_strong(self) -> float:
         """強軸断面係数"""
-        pass
+        ...
 
     @property
-    @abstractmethod
     def section_modulus_weak(self) -> float:
         """弱軸断面係数"""
-        pass
+        ...
 
     @property
-    @abstractmethod
     def torsion_constant(self) -> float:
         """ねじり定数"""
-        pass
+        ...
 
     @property
-    @abstractmethod
     def warping_constant(self) -> float:
         """そり定数"""
-        pass
+        ...
+
+
+# 旧名称の後方互換エイリアス
+steel_section = SteelSection
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SteelSectionProperties(SectionProperties):
     """鋼材断面特有の性能値"""
     plastic_moment_x: float
@@ -64,115 +80,713 @@ class SteelSectionProperties(SectionProperties):
     shear_center_x: float
     shear_center_y: float
 
+
+# SteelSectionProperties の一括格納用 structured dtype (SoA レイアウト)
+_PROPS_DTYPE = np.dtype([
+    ('area', 'f8'), ('Ix', 'f8'), ('Iy', 'f8'), ('J', 'f8'),
+    ('Mpx', 'f8'), ('Mpy', 'f8'), ('Cw', 'f8'), ('xs', 'f8'), ('ys', 'f8')])
+
+
+def properties_to_array(props: list[SteelSectionProperties]) -> np.ndarray:
+    """SteelSectionProperties のリストを structured ndarray に変換する
+
+    大量の計算結果を連続メモリに詰め替えることで、後段の
+    ベクトル化された設計検定から ufunc 演算で直接扱えるようにする。
+    """
+    out = np.empty(len(props), dtype=_PROPS_DTYPE)
+    for i, p in enumerate(props):
+        out[i] = (p.area, p.moment_of_inertia_x, p.moment_of_inertia_y,
+                  p.torsional_constant, p.plastic_moment_x, p.plastic_moment_y,
+                  p.warping_constant, p.shear_center_x, p.shear_center_y)
+    return out
+
+@lru_cache(maxsize=2048)
+def lipped_channel_properties(h: float, b: float, d: float,
+                              t_w: float, t_f: float,
+                              t_l: float) -> SteelSectionProperties:
+    """リップ付き溝形鋼の断面性能を寸法から直接計算する
+
+    数値だけが欲しいワークフロー (最適化ループなど) 向けの関数 API。
+    クラス経由のディスクリプタ参照を挟まない正規の高速経路で、
+    LippedChannelSection.calculate_properties もここへ委譲する。
+    結果は寸法をキーとする lru_cache で共有される。
+
+    冷間成形材に多い一様板厚 (t_w == t_f == t_l) の断面は、板厚を
+    くくり出した特殊化カーネルへディスパッチする。
+    """
+    if t_w == t_f == t_l:
+        (area, x_c, y_c, I_x, I_y,
+         Z_x, Z_y, J, C_w, x_s) = calc_lipped_channel_uniform(h, b, d, t_w)
+    else:
+        (area, x_c, y_c, I_x, I_y,
+         Z_x, Z_y, J, C_w, x_s) = calc_lipped_channel(h, b, d, t_w, t_f, t_l)
+    return SteelSectionProperties(
+        area=area,
+        moment_of_inertia_x=I_x,
+        moment_of_inertia_y=I_y,
+        torsional_constant=J,
+        plastic_moment_x=1.5 * Z_x,
+        plastic_moment_y=1.5 * Z_y,
+        warping_constant=C_w,
+        shear_center_x=x_s,
+        shear_center_y=y_c)
+
+
+@dataclass(frozen=True)
 class LippedChannelSection(ThinWalledSection):
     """リップ付き溝形鋼の具体的な実装"""
-    def __init__(self, h: float, b: float, d: float, 
-                 t_w: float, t_f: float, t_l: float):
-        self.h = h
-        self.b = b
-        self.d = d
-        self.t_w = t_w
-        self.t_f = t_f
-        self.t_l = t_l
+    h: float
+    b: float
+    d: float
+    t_w: float
+    t_f: float
+    t_l: float
+
+    def __post_init__(self):
         self._validate_dimensions()
 
-    @property
+    @cached_property
     def area(self) -> float:
         """断面積"""
         return (self.h * self.t_w + 
                 2 * self.b * self.t_f + 
                 2 * self.d * self.t_l)
 
-    @property
-    def centroid(self) -> Tuple[float, float]:
+    @cached_property
+    def centroid(self) -> Point:
         """重心位置 (x, y)"""
-        x_c = (2 * self.b * self.t_f * self.b/2 + 
-               2 * self.d * self.t_l * (self.b + self.d/2)) / self.area
-        y_c = self.h / 2  # 上下対称
-        return (x_c, y_c)
+        b, d = self.b, self.d
+        x_c = (b * self.t_f * b +
+               2 * d * self.t_l * (b + d * HALF)) / self.area
+        y_c = self.h * HALF  # 上下対称
+        return Point(x_c, y_c)
 
-    @property
+    @cached_property
     def moment_of_inertia_strong(self) -> float:
         """強軸断面二次モーメント (Ix)"""
+        h, b, d = self.h, self.b, self.d
+        t_w, t_f, t_l = self.t_w, self.t_f, self.t_l
+        lip_arm = b + d * HALF
+
         # ウェブの寄与
-        I_web = self.t_w * self.h**3 / 12
-        
-        # フランジの寄与
-        I_flange = 2 * (self.t_f * self.b**3 / 12 + 
-                        self.b * self.t_f * (self.b/2)**2)
-        
+        I_web = t_w * h * h * h * ONE_TWELFTH
+
+        # フランジの寄与 (2*(t_f*b**3/12 + b*t_f*(b/2)**2) を約分した形)
+        I_flange = 2 * t_f * b * b * b * ONE_THIRD
+
         # リップの寄与
-        I_lip = 2 * (self.t_l * self.d**3 / 12 + 
-                     self.d * self.t_l * (self.b + self.d/2)**2)
-        
+        d_tl = d * t_l
+        I_lip = d_tl * d * d * ONE_SIXTH + 2 * d_tl * lip_arm * lip_arm
+
         return I_web + I_flange + I_lip
 
-    @property
+    @cached_property
     def moment_of_inertia_weak(self) -> float:
         """弱軸断面二次モーメント (Iy)"""
+        h, b, d = self.h, self.b, self.d
+        t_w, t_f, t_l = self.t_w, self.t_f, self.t_l
+        half_h = h * HALF
+        half_h_sq = half_h * half_h
+
         # ウェブの寄与
-        I_web = self.h * self.t_w**3 / 12
-        
-        # フランジの寄与
-        I_flange = 2 * self.b * self.t_f * (self.h/2)**2
-        
-        # リップの寄与
-        I_lip = 2 * self.d * self.t_l * (self.h/2)**2
-        
+        I_web = h * t_w * t_w * t_w * ONE_TWELFTH
+
+        # フランジ・リップの寄与 (腕長 h/2 が共通)
+        I_flange = 2 * b * t_f * half_h_sq
+        I_lip = 2 * d * t_l * half_h_sq
+
         return I_web + I_flange + I_lip
 
-    @property
+    @cached_property
     def section_modulus_strong(self) -> float:
         """強軸断面係数"""
-        return self.moment_of_inertia_strong / (self.h/2)
+        return self.moment_of_inertia_strong / (self.h * HALF)
 
-    @property
+    @cached_property
     def section_modulus_weak(self) -> float:
         """弱軸断面係数"""
         x_c = self.centroid[0]
         return self.moment_of_inertia_weak / x_c
 
-    @property
+    @cached_property
     def torsion_constant(self) -> float:
         """ねじり定数 (J)"""
+        t_w, t_f, t_l = self.t_w, self.t_f, self.t_l
         # 薄肉断面の近似式
-        return (self.h * self.t_w**3 + 
-                2 * self.b * self.t_f**3 + 
-                2 * self.d * self.t_l**3) / 3
+        return (self.h * t_w * t_w * t_w +
+                2 * self.b * t_f * t_f * t_f +
+                2 * self.d * t_l * t_l * t_l) * ONE_THIRD
 
-    @property
+    @cached_property
     def warping_constant(self) -> float:
         """そり定数 (Cw)"""
+        h = self.h
         # 近似式
-        return (self.moment_of_inertia_weak * self.h**2 / 4) * \
-               (1 - (3 * self.b) / (2 * self.h))
+        return (self.moment_of_inertia_weak * h * h * 0.25) * \
+               (1 - 1.5 * self.b / h)
 
-    @property
-    def shear_center(self) -> Tuple[float, float]:
+    @cached_property
+    def shear_center(self) -> Point:
         """せん断中心位置 (x, y)"""
+        h, b = self.h, self.b
+        I_y = self.moment_of_inertia_weak
+
         # リップの影響を考慮した修正係数
-        k = 1 + (self.d/self.b)**2 * (self.t_l/self.t_f)
-        
-        x_s = self.b * (self.h**2 * self.t_w + 
-                        4 * self.b * self.t_f * self.h * k) / \
-              (4 * self.moment_of_inertia_weak)
-        y_s = self.h / 2  # 上下対称
-        
-        return (x_s, y_s)
-    
+        d_b = self.d / b
+        k = 1 + d_b * d_b * (self.t_l/self.t_f)
+
+        x_s = b * (h * h * self.t_w + 4 * b * self.t_f * h * k) / (4 * I_y)
+        y_s = h * HALF  # 上下対称
+
+        return Point(x_s, y_s)
+
+    @cached_property
+    def web_width_thickness_ratio(self) -> float:
+        """ウェブ幅厚比"""
+        return self.h / self.t_w
+
+    @cached_property
+    def flange_width_thickness_ratio(self) -> float:
+        """フランジ幅厚比"""
+        return self.b / self.t_f
+
+    @cached_property
+    def lip_width_thickness_ratio(self) -> float:
+        """リップ幅厚比"""
+        return self.d / self.t_l
+
+    @classmethod
+    def calculate_properties_batch(cls, h, b, d, t_w, t_f, t_l) -> np.recarray:
+        """断面性能の一括計算 (NumPy 配列入力)
+
+        寸法ごとの 1 次元配列を受け取り、全断面の性能値を
+        ufunc 演算のみで一括評価した recarray
+        (area, Ix, Iy, J, Mpx, Mpy, Cw, xs, ys) を返す。
+        """
+        h = np.asarray(h, dtype=np.float64)
+        b = np.asarray(b, dtype=np.float64)
+        d = np.asarray(d, dtype=np.float64)
+        t_w = np.asarray(t_w, dtype=np.float64)
+        t_f = np.asarray(t_f, dtype=np.float64)
+        t_l = np.asarray(t_l, dtype=np.float64)
+
+        if (_lc_properties_rs is not None and h.ndim == 1 and
+                h.shape == b.shape == d.shape ==
+                t_w.shape == t_f.shape == t_l.shape):
+            cols = _lc_properties_rs(
+                np.ascontiguousarray(h), np.ascontiguousarray(b),
+                np.ascontiguousarray(d), np.ascontiguousarray(t_w),
+                np.ascontiguousarray(t_f), np.ascontiguousarray(t_l))
+            return np.rec.fromarrays(
+                list(cols.T), names='area,Ix,Iy,J,Mpx,Mpy,Cw,xs,ys')
+
+        # 出力 recarray と 2 本のスクラッチを先に確保し、以降の ufunc は
+        # すべて out= で書き込む。大きな N でも途中式ごとの一時配列が
+        # 生成されず、メモリ確保量が入力サイズによらず一定になる。
+        h, b, d, t_w, t_f, t_l = np.broadcast_arrays(h, b, d, t_w, t_f, t_l)
+        shape = h.shape
+        rec = np.recarray(shape, dtype=_PROPS_DTYPE)
+        s1 = np.empty(shape)
+        s2 = np.empty(shape)
+
+        # 複数の式で再利用する中間量は一度だけ確保する
+        half_h = h * HALF
+        half_h_sq = half_h * half_h
+        lip_arm = b + d * HALF
+        a_web = h * t_w
+        a_fl = b * t_f
+        a_lp = d * t_l
+
+        # area = a_web + 2*a_fl + 2*a_lp
+        np.multiply(a_fl, 2.0, out=s1)
+        np.add(a_web, s1, out=rec.area)
+        np.multiply(a_lp, 2.0, out=s1)
+        np.add(rec.area, s1, out=rec.area)
+
+        # x_c = (a_fl*b + 2*a_lp*lip_arm) / area
+        np.multiply(a_fl, b, out=s1)
+        np.multiply(a_lp, 2.0, out=s2)
+        np.multiply(s2, lip_arm, out=s2)
+        np.add(s1, s2, out=s1)
+        x_c = np.divide(s1, rec.area, out=np.empty(shape))
+
+        # Ix = a_web*h²/12 + 2*a_fl*b²/3 + a_lp*d²/6 + 2*a_lp*lip_arm²
+        np.multiply(a_web, h, out=s1)
+        np.multiply(s1, h, out=s1)
+        np.multiply(s1, ONE_TWELFTH, out=rec.Ix)
+        np.multiply(a_fl, 2.0, out=s1)
+        np.multiply(s1, b, out=s1)
+        np.multiply(s1, b, out=s1)
+        np.multiply(s1, ONE_THIRD, out=s1)
+        np.add(rec.Ix, s1, out=rec.Ix)
+        np.multiply(a_lp, d, out=s1)
+        np.multiply(s1, d, out=s1)
+        np.multiply(s1, ONE_SIXTH, out=s1)
+        np.add(rec.Ix, s1, out=rec.Ix)
+        np.multiply(a_lp, 2.0, out=s1)
+        np.multiply(s1, lip_arm, out=s1)
+        np.multiply(s1, lip_arm, out=s1)
+        np.add(rec.Ix, s1, out=rec.Ix)
+
+        # Iy = a_web*t_w²/12 + 2*(a_fl + a_lp)*(h/2)²
+        np.multiply(a_web, t_w, out=s1)
+        np.multiply(s1, t_w, out=s1)
+        np.multiply(s1, ONE_TWELFTH, out=rec.Iy)
+        np.multiply(a_fl, 2.0, out=s1)
+        np.multiply(s1, half_h_sq, out=s1)
+        np.add(rec.Iy, s1, out=rec.Iy)
+        np.multiply(a_lp, 2.0, out=s1)
+        np.multiply(s1, half_h_sq, out=s1)
+        np.add(rec.Iy, s1, out=rec.Iy)
+
+        # Mpx = 1.5*Zx, Mpy = 1.5*Zy
+        np.divide(rec.Ix, half_h, out=s1)
+        np.multiply(s1, 1.5, out=rec.Mpx)
+        np.divide(rec.Iy, x_c, out=s1)
+        np.multiply(s1, 1.5, out=rec.Mpy)
+
+        # J = (a_web*t_w² + 2*a_fl*t_f² + 2*a_lp*t_l²) / 3
+        np.multiply(a_web, t_w, out=rec.J)
+        np.multiply(rec.J, t_w, out=rec.J)
+        np.multiply(a_fl, 2.0, out=s1)
+        np.multiply(s1, t_f, out=s1)
+        np.multiply(s1, t_f, out=s1)
+        np.add(rec.J, s1, out=rec.J)
+        np.multiply(a_lp, 2.0, out=s1)
+        np.multiply(s1, t_l, out=s1)
+        np.multiply(s1, t_l, out=s1)
+        np.add(rec.J, s1, out=rec.J)
+        np.multiply(rec.J, ONE_THIRD, out=rec.J)
+
+        # Cw = (Iy*h²/4) * (1 - 1.5*b/h)
+        np.multiply(rec.Iy, h, out=rec.Cw)
+        np.multiply(rec.Cw, h, out=rec.Cw)
+        np.multiply(rec.Cw, 0.25, out=rec.Cw)
+        np.multiply(b, 1.5, out=s1)
+        np.divide(s1, h, out=s1)
+        np.subtract(1.0, s1, out=s1)
+        np.multiply(rec.Cw, s1, out=rec.Cw)
+
+        # xs = b * (h²*t_w + 4*b*t_f*h*k) / (4*Iy), k = 1 + (d/b)²*(t_l/t_f)
+        np.divide(d, b, out=s1)
+        np.multiply(s1, s1, out=s1)
+        np.divide(t_l, t_f, out=s2)
+        np.multiply(s1, s2, out=s1)
+        np.add(s1, 1.0, out=s1)
+        np.multiply(b, 4.0, out=s2)
+        np.multiply(s2, t_f, out=s2)
+        np.multiply(s2, h, out=s2)
+        np.multiply(s2, s1, out=s2)
+        np.multiply(h, h, out=s1)
+        np.multiply(s1, t_w, out=s1)
+        np.add(s1, s2, out=s1)
+        np.multiply(b, s1, out=s1)
+        np.multiply(rec.Iy, 4.0, out=s2)
+        np.divide(s1, s2, out=rec.xs)
+
+        np.copyto(rec.ys, half_h)
+
+        return rec
+
     def calculate_properties(self) -> SteelSectionProperties:
-        # 具体的な断面性能計算の実装
-        return SteelSectionProperties(...)
-    
+        """断面性能の計算
+
+        規格断面の再照会でも再計算しないよう、モジュールレベルの
+        関数 API (lipped_channel_properties) へ委譲する。
+        """
+        return lipped_channel_properties(
+            self.h, self.b, self.d, self.t_w, self.t_f, self.t_l)
+
+    def with_dimensions(self, **changes) -> "LippedChannelSection":
+        """寸法の一部を差し替えた新しい断面を返す
+
+        断面は不変 (frozen) なので、設計反復で t_f などを振る場合は
+        本メソッドで置き換える。新インスタンスのキャッシュは空の状態で
+        始まるため、cached_property の明示的な無効化は不要。
+        """
+        return replace(self, **changes)
+
     def _validate_dimensions(self):
         """寸法の妥当性検証"""
-        if self.h <= 0 or self.b <= 0 or self.d <= 0:
+        if min(self.h, self.b, self.d) <= 0:
             raise ValueError("寸法は正の値である必要があります")
+        if min(self.t_w, self.t_f, self.t_l) <= 0:
+            raise ValueError("板厚は正の値である必要があります")
+
+    def validate(self) -> bool:
+        """断面の妥当性検証"""
+        self._validate_dimensions()
+        return True
+
+    def calculate_warping_constant(self) -> float:
+        """そり定数の計算"""
+        return self.warping_constant
+
+    def calculate_shear_center(self) -> Point:
+        """せん断中心の計算"""
+        return self.shear_center
+
+
+class LippedChannelSectionArray:
+    """リップ付き溝形鋼の SoA (Structure of Arrays) 表現
+
+    N 断面分の寸法を float64 の 1 次元配列として保持し、
+    LippedChannelSection と同名の断面性能をベクトル化された
+    NumPy 演算で一括評価する。パラメトリックスタディのように
+    数千〜数百万断面を扱う場合のための表現で、
+    Python オブジェクトを断面ごとに作るコストを回避する。
+    """
+
+    def __init__(self, h, b, d, t_w, t_f, t_l):
+        self.h = np.ascontiguousarray(h, dtype=np.float64)
+        self.b = np.ascontiguousarray(b, dtype=np.float64)
+        self.d = np.ascontiguousarray(d, dtype=np.float64)
+        self.t_w = np.ascontiguousarray(t_w, dtype=np.float64)
+        self.t_f = np.ascontiguousarray(t_f, dtype=np.float64)
+        self.t_l = np.ascontiguousarray(t_l, dtype=np.float64)
+        self._validate_dimensions()
 
+    def __len__(self) -> int:
+        return len(self.h)
+
+    @cached_property
+    def area(self) -> np.ndarray:
+        """断面積"""
+        return (self.h * self.t_w +
+                2 * self.b * self.t_f +
+                2 * self.d * self.t_l)
+
+    @cached_property
+    def centroid(self) -> Tuple[np.ndarray, np.ndarray]:
+        """重心位置 (x, y)"""
+        b, d = self.b, self.d
+        x_c = (b * self.t_f * b +
+               2 * d * self.t_l * (b + d * HALF)) / self.area
+        y_c = self.h * HALF  # 上下対称
+        return (x_c, y_c)
+
+    @cached_property
+    def moment_of_inertia_strong(self) -> np.ndarray:
+        """強軸断面二次モーメント (Ix)"""
+        h, b, d = self.h, self.b, self.d
+        d_tl = d * self.t_l
+        lip_arm = b + d * HALF
+        return (self.t_w * h * h * h * ONE_TWELFTH +
+                2 * self.t_f * b * b * b * ONE_THIRD +
+                d_tl * d * d * ONE_SIXTH + 2 * d_tl * lip_arm * lip_arm)
+
+    @cached_property
+    def moment_of_inertia_weak(self) -> np.ndarray:
+        """弱軸断面二次モーメント (Iy)"""
+        h, t_w = self.h, self.t_w
+        half_h = h * HALF
+        half_h_sq = half_h * half_h
+        return (h * t_w * t_w * t_w * ONE_TWELFTH +
+                2 * self.b * self.t_f * half_h_sq +
+                2 * self.d * self.t_l * half_h_sq)
 
+    @cached_property
+    def section_modulus_strong(self) -> np.ndarray:
+        """強軸断面係数"""
+        return self.moment_of_inertia_strong / (self.h * HALF)
+
+    @cached_property
+    def section_modulus_weak(self) -> np.ndarray:
+        """弱軸断面係数"""
+        return self.moment_of_inertia_weak / self.centroid[0]
+
+    @cached_property
+    def torsion_constant(self) -> np.ndarray:
+        """ねじり定数 (J)"""
+        t_w, t_f, t_l = self.t_w, self.t_f, self.t_l
+        # 薄肉断面の近似式
+        return (self.h * t_w * t_w * t_w +
+                2 * self.b * t_f * t_f * t_f +
+                2 * self.d * t_l * t_l * t_l) * ONE_THIRD
+
+    @cached_property
+    def warping_constant(self) -> np.ndarray:
+        """そり定数 (Cw)"""
+        h = self.h
+        # 近似式
+        return (self.moment_of_inertia_weak * h * h * 0.25) * \
+               (1 - 1.5 * self.b / h)
+
+    @cached_property
+    def shear_center(self) -> Tuple[np.ndarray, np.ndarray]:
+        """せん断中心位置 (x, y)"""
+        h, b = self.h, self.b
+        I_y = self.moment_of_inertia_weak
+        d_b = self.d / b
+        k = 1 + d_b * d_b * (self.t_l/self.t_f)
+        x_s = b * (h * h * self.t_w + 4 * b * self.t_f * h * k) / (4 * I_y)
+        y_s = h * HALF  # 上下対称
+        return (x_s, y_s)
+
+    def calculate_properties(self) -> np.recarray:
+        """断面性能の一括計算
+
+        Numba がある環境では guvectorize 版カーネル (GIL 解放・並列) で
+        評価し、ない環境では NumPy のバッチ実装へフォールバックする。
+        """
+        if calc_lipped_channel_batch is not None:
+            (area, x_c, y_c, I_x, I_y,
+             Z_x, Z_y, J, C_w, x_s) = calc_lipped_channel_batch(
+                self.h, self.b, self.d, self.t_w, self.t_f, self.t_l)
+            return np.rec.fromarrays(
+                [area, I_x, I_y, J, 1.5 * Z_x, 1.5 * Z_y, C_w, x_s, y_c],
+                names='area,Ix,Iy,J,Mpx,Mpy,Cw,xs,ys')
+        return LippedChannelSection.calculate_properties_batch(
+            self.h, self.b, self.d, self.t_w, self.t_f, self.t_l)
+
+    def _validate_dimensions(self):
+        """寸法の妥当性検証"""
+        dims = (self.h, self.b, self.d, self.t_w, self.t_f, self.t_l)
+        if any(arr.shape != self.h.shape for arr in dims):
+            raise ValueError("寸法配列の形状が一致していません")
+        if not all((arr > 0).all() for arr in dims):
+            raise ValueError("寸法は正の値である必要があります")
+
+
+class SteelGrade(IntEnum):
+    """鋼材グレード (値は幅厚比制限値テーブルの行インデックス)"""
+    SN400 = 0
+    SN490 = 1
+    SM490 = 2
+    SM520 = 3
+
+
+# 幅厚比制限値テーブル (行: SteelGrade 値, 列: [ウェブ, フランジ])
+# 整数インデックスの gather 一発で引けるよう NumPy 配列で持つ
+_WT_LIMITS_TABLE = np.array(
+    [[72, 12],   # SN400
+     [67, 11],   # SN490
+     [67, 11],   # SM490
+     [60, 10]],  # SM520
+    dtype=np.int16)
+
+# 文字列グレードの一括変換用: searchsorted で引けるソート済み名称と対応コード
+_WT_GRADES = np.array(sorted(SteelGrade.__members__))
+_WT_GRADE_CODES = np.array([SteelGrade[g] for g in _WT_GRADES])
+
+
+@dataclass(frozen=True)
 class HSection(ThinWalledSection):
     """H形鋼の具体的な実装"""
-    pass
+    h: float
+    b: float
+    t_w: float
+    t_f: float
+
+    def __post_init__(self):
+        self._validate_dimensions()
+
+    @cached_property
+    def area(self) -> float:
+        """断面積"""
+        return 2 * self.b * self.t_f + (self.h - 2 * self.t_f) * self.t_w
+
+    @cached_property
+    def centroid(self) -> Point:
+        """重心位置 (x, y)"""
+        return Point(0.0, self.h * HALF)  # 2軸対称
+
+    @cached_property
+    def moment_of_inertia_strong(self) -> float:
+        """強軸断面二次モーメント (Ix)"""
+        h, b = self.h, self.b
+        h_web = h - 2 * self.t_f
+        return (b * h * h * h * ONE_TWELFTH -
+                (b - self.t_w) * h_web * h_web * h_web * ONE_TWELFTH)
+
+    @cached_property
+    def moment_of_inertia_weak(self) -> float:
+        """弱軸断面二次モーメント (Iy)"""
+        b, t_w = self.b, self.t_w
+        h_web = self.h - 2 * self.t_f
+        return (self.t_f * b * b * b * ONE_SIXTH +
+                h_web * t_w * t_w * t_w * ONE_TWELFTH)
+
+    @cached_property
+    def section_modulus_strong(self) -> float:
+        """強軸断面係数"""
+        return self.moment_of_inertia_strong / (self.h * HALF)
+
+    @cached_property
+    def section_modulus_weak(self) -> float:
+        """弱軸断面係数"""
+        return self.moment_of_inertia_weak / (self.b * HALF)
+
+    @cached_property
+    def plastic_modulus_strong(self) -> float:
+        """強軸塑性断面係数"""
+        h, t_f = self.h, self.t_f
+        h_web = h - 2 * t_f
+        return (self.b * t_f * (h - t_f) +
+                self.t_w * h_web * h_web * 0.25)
+
+    @cached_property
+    def plastic_modulus_weak(self) -> float:
+        """弱軸塑性断面係数"""
+        b, t_w = self.b, self.t_w
+        h_web = self.h - 2 * self.t_f
+        return (self.t_f * b * b * HALF +
+                h_web * t_w * t_w * 0.25)
+
+    @cached_property
+    def torsion_constant(self) -> float:
+        """ねじり定数 (J)"""
+        t_w, t_f = self.t_w, self.t_f
+        # 薄肉断面の近似式
+        return (2 * self.b * t_f * t_f * t_f +
+                (self.h - 2 * t_f) * t_w * t_w * t_w) * ONE_THIRD
+
+    @cached_property
+    def warping_constant(self) -> float:
+        """そり定数 (Cw)"""
+        arm = self.h - self.t_f
+        return self.moment_of_inertia_weak * arm * arm * 0.25
+
+    @cached_property
+    def shear_center(self) -> Point:
+        """せん断中心位置 (x, y)"""
+        return self.centroid  # 2軸対称のため重心に一致
+
+    @cached_property
+    def web_width_thickness_ratio(self) -> float:
+        """ウェブ幅厚比"""
+        return (self.h - 2 * self.t_f) / self.t_w
+
+    @cached_property
+    def flange_width_thickness_ratio(self) -> float:
+        """フランジ幅厚比"""
+        return (self.b * HALF) / self.t_f
+
+    def check_width_thickness_ratios(self, steel_grade) -> dict:
+        """幅厚比の検定
+
+        鋼材グレードごとの制限値 (_WT_LIMITS_TABLE) に対して
+        ウェブ・フランジの幅厚比を照査する。
+        steel_grade は SteelGrade または従来どおりの文字列を受け付ける。
+        """
+        if not isinstance(steel_grade, SteelGrade):
+            try:
+                steel_grade = SteelGrade[steel_grade]
+            except KeyError:
+                raise ValueError(f"未対応の鋼材グレードです: {steel_grade}")
+        web_limit, flange_limit = (int(v) for v in _WT_LIMITS_TABLE[steel_grade])
+
+        web_ratio = self.web_width_thickness_ratio
+        flange_ratio = self.flange_width_thickness_ratio
+
+        return {
+            'web': {
+                'ratio': web_ratio,
+                'limit': web_limit,
+                'ok': web_ratio <= web_limit,
+            },
+            'flange': {
+                'ratio': flange_ratio,
+                'limit': flange_limit,
+                'ok': flange_ratio <= flange_limit,
+            },
+        }
+
+    def check_width_thickness_ratios_formatted(self, steel_grade) -> dict:
+        """幅厚比の検定 (表示用に比率を丸めた結果を返す)"""
+        result = self.check_width_thickness_ratios(steel_grade)
+        for part in result.values():
+            part['ratio'] = round(part['ratio'], 2)
+        return result
+
+    @classmethod
+    def check_width_thickness_ratios_batch(cls, h, b, t_w, t_f, grades) -> np.recarray:
+        """幅厚比の一括検定 (NumPy 配列入力)
+
+        寸法の 1 次元配列と鋼材グレード (文字列または SteelGrade 値) の
+        配列を受け取り、全断面の幅厚比・制限値・判定を recarray で返す。
+        """
+        h = np.asarray(h, dtype=np.float64)
+        b = np.asarray(b, dtype=np.float64)
+        t_w = np.asarray(t_w, dtype=np.float64)
+        t_f = np.asarray(t_f, dtype=np.float64)
+        grades = np.asarray(grades)
+
+        if np.issubdtype(grades.dtype, np.integer):
+            codes = grades
+            # 範囲外コードが負インデックスで別グレードに化けないよう検証する
+            invalid = (codes < 0) | (codes >= len(_WT_LIMITS_TABLE))
+            if invalid.any():
+                unknown = np.unique(codes[invalid])
+                raise ValueError(
+                    f"未対応の鋼材グレードです: {', '.join(map(str, unknown))}")
+        else:
+            idx = np.searchsorted(_WT_GRADES, grades)
+            idx = np.clip(idx, 0, len(_WT_GRADES) - 1)
+            if not np.array_equal(_WT_GRADES[idx], grades):
+                unknown = np.unique(grades[_WT_GRADES[idx] != grades])
+                raise ValueError(f"未対応の鋼材グレードです: {', '.join(unknown)}")
+            codes = _WT_GRADE_CODES[idx]
+
+        limits = _WT_LIMITS_TABLE[codes]
+        web_limit = limits[..., 0]
+        flange_limit = limits[..., 1]
+        web_ratio = (h - 2 * t_f) / t_w
+        flange_ratio = (b * HALF) / t_f
+
+        return np.rec.fromarrays(
+            [web_ratio, web_limit, web_ratio <= web_limit,
+             flange_ratio, flange_limit, flange_ratio <= flange_limit],
+            names='web_ratio,web_limit,web_ok,'
+                  'flange_ratio,flange_limit,flange_ok')
+
+    def calculate_properties(self) -> SteelSectionProperties:
+        """断面性能の計算
+
+        規格断面の再照会でも再計算しないよう、寸法をキーとする
+        モジュールレベルのキャッシュ (_hsection_properties) を共有する。
+        """
+        return _hsection_properties(self.h, self.b, self.t_w, self.t_f)
+
+    def _compute_properties(self) -> SteelSectionProperties:
+        """断面性能の計算本体 (キャッシュミス時のみ実行される)"""
+        return SteelSectionProperties(
+            area=self.area,
+            moment_of_inertia_x=self.moment_of_inertia_strong,
+            moment_of_inertia_y=self.moment_of_inertia_weak,
+            torsional_constant=self.torsion_constant,
+            plastic_moment_x=self.plastic_modulus_strong,
+            plastic_moment_y=self.plastic_modulus_weak,
+            warping_constant=self.warping_constant,
+            shear_center_x=self.shear_center[0],
+            shear_center_y=self.shear_center[1])
+
+    def _validate_dimensions(self):
+        """寸法の妥当性検証"""
+        if min(self.h, self.b) <= 0:
+            raise ValueError("寸法は正の値である必要があります")
+        if min(self.t_w, self.t_f) <= 0:
+            raise ValueError("板厚は正の値である必要があります")
+
+    def validate(self) -> bool:
+        """断面の妥当性検証"""
+        self._validate_dimensions()
+        return True
+
+    def calculate_warping_constant(self) -> float:
+        """そり定数の計算"""
+        return self.warping_constant
+
+    def calculate_shear_center(self) -> Point:
+        """せん断中心の計算"""
+        return self.shear_center
+
+
+@lru_cache(maxsize=2048)
+def _hsection_properties(h: float, b: float, t_w: float,
+                         t_f: float) -> SteelSectionProperties:
+    """H形鋼断面性能の寸法キー共有キャッシュ"""
+    return HSection(h, b, t_w, t_f)._compute_properties()
 
 
 class BoxSection(ThinWalledSection):
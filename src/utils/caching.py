@@ -0,0 +1,27 @@
+"""キャッシュ関連のユーティリティ"""
+
+
+class cached_property:
+    """ロックを持たない軽量版 cached_property
+
+    functools.cached_property は Python 3.11 までクラス単位の RLock を
+    持ち、マルチスレッドでは初回アクセスが直列化される。断面性能の
+    ような冪等で安価な計算は稀な重複評価を許容してよいため、計算結果を
+    インスタンスの __dict__ へ直接書き込むだけの実装で置き換える。
+    2 回目以降のアクセスは通常の属性参照として解決される。
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.attrname = None
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        self.attrname = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.func(instance)
+        instance.__dict__[self.attrname] = value
+        return value
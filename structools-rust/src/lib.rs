@@ -0,0 +1,86 @@
+//! リップ付き溝形鋼断面性能のバッチ計算カーネル (Rust/PyO3 版)
+//!
+//! Python 側の NumPy カーネルと同じ閉形式・同じ列順
+//! (area, Ix, Iy, J, Mpx, Mpy, Cw, xs, ys) で N×9 の f64 行列を返す。
+//! インタプリタのディスパッチを完全に排除し、LLVM の自動ベクトル化に
+//! 直線的な f64 演算ループを渡すことが目的。
+
+use ndarray::{Array2, Zip};
+use numpy::{IntoPyArray, PyArray2, PyReadonlyArray1};
+use pyo3::exceptions::PyValueError;
+use pyo3::prelude::*;
+
+#[pyfunction]
+fn lc_properties<'py>(
+    py: Python<'py>,
+    h: PyReadonlyArray1<'py, f64>,
+    b: PyReadonlyArray1<'py, f64>,
+    d: PyReadonlyArray1<'py, f64>,
+    t_w: PyReadonlyArray1<'py, f64>,
+    t_f: PyReadonlyArray1<'py, f64>,
+    t_l: PyReadonlyArray1<'py, f64>,
+) -> PyResult<Bound<'py, PyArray2<f64>>> {
+    let h = h.as_array();
+    let b = b.as_array();
+    let d = d.as_array();
+    let t_w = t_w.as_array();
+    let t_f = t_f.as_array();
+    let t_l = t_l.as_array();
+
+    let n = h.len();
+    if [b.len(), d.len(), t_w.len(), t_f.len(), t_l.len()]
+        .iter()
+        .any(|&len| len != n)
+    {
+        return Err(PyValueError::new_err(
+            "all dimension arrays must have the same length",
+        ));
+    }
+
+    let mut out = Array2::<f64>::zeros((n, 9));
+    Zip::indexed(out.rows_mut()).for_each(|i, mut row| {
+        let (h, b, d) = (h[i], b[i], d[i]);
+        let (tw, tf, tl) = (t_w[i], t_f[i], t_l[i]);
+
+        let half_h = 0.5 * h;
+        let lip_arm = b + 0.5 * d;
+        let d_tl = d * tl;
+
+        let area = h * tw + 2.0 * b * tf + 2.0 * d_tl;
+        let x_c = (b * tf * b + 2.0 * d_tl * lip_arm) / area;
+
+        let i_x = tw * h * h * h / 12.0
+            + 2.0 * tf * b * b * b / 3.0
+            + d_tl * d * d / 6.0
+            + 2.0 * d_tl * lip_arm * lip_arm;
+        let i_y = h * tw * tw * tw / 12.0
+            + 2.0 * (b * tf + d_tl) * half_h * half_h;
+
+        let z_x = i_x / half_h;
+        let z_y = i_y / x_c;
+
+        let j = (h * tw * tw * tw + 2.0 * b * tf * tf * tf + 2.0 * d * tl * tl * tl) / 3.0;
+        let c_w = (i_y * h * h * 0.25) * (1.0 - 1.5 * b / h);
+
+        let k = 1.0 + (d / b) * (d / b) * (tl / tf);
+        let x_s = b * (h * h * tw + 4.0 * b * tf * h * k) / (4.0 * i_y);
+
+        row[0] = area;
+        row[1] = i_x;
+        row[2] = i_y;
+        row[3] = j;
+        row[4] = 1.5 * z_x;
+        row[5] = 1.5 * z_y;
+        row[6] = c_w;
+        row[7] = x_s;
+        row[8] = half_h;
+    });
+
+    Ok(out.into_pyarray(py))
+}
+
+#[pymodule]
+fn _structools_rs(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    m.add_function(wrap_pyfunction!(lc_properties, m)?)?;
+    Ok(())
+}